@@ -2,7 +2,10 @@
 
 __all__: list[str] = []
 
-from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, cast, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, runtime_checkable
+
+import jax
+import numpy as np
 
 import coordinax as cx
 import quaxed.numpy as jnp
@@ -33,6 +36,9 @@ else:  # need runtime for jaxtyping
 
 # -----------------------------------------------------------------------------
 
+# Time index for a Sz1 time array, built once rather than on every call.
+_TRUE_ONE = jnp.asarray([True])
+
 
 def _getitem_vec1time_index_tuple(index: tuple[Any, ...], t: gt.FloatQuSzAny) -> Any:
     """Get the time index from a slice."""
@@ -46,10 +52,12 @@ def _getitem_vec1time_index_tuple(index: tuple[Any, ...], t: gt.FloatQuSzAny) ->
     return index
 
 
-def _getitem_vec1time_index_shaped(index: HasShape, t: gt.FloatQuSzAny) -> HasShape:
+def _getitem_vec1time_index_shaped(
+    index: jax.Array | np.ndarray[Any, Any] | HasShape, t: gt.FloatQuSzAny
+) -> jax.Array | np.ndarray[Any, Any] | HasShape:
     """Get the time index from a shaped index array."""
     if t.ndim == 1:  # Sz1
-        return cast(HasShape, jnp.asarray([True]))
+        return _TRUE_ONE
     if len(index.shape) >= t.ndim:
         msg = f"Index {index} has too many dimensions for time array of shape {t.shape}"
         raise IndexError(msg)
@@ -101,6 +109,8 @@ def getitem_vec1time_index(index: Any, t: gt.FloatQuSzAny) -> Any:
     """
     if isinstance(index, tuple):
         return _getitem_vec1time_index_tuple(index, t)
-    if isinstance(index, HasShape):
+    # Concrete array types are checked first, before the slower runtime
+    # Protocol check.
+    if isinstance(index, (jax.Array, np.ndarray, HasShape)):
         return _getitem_vec1time_index_shaped(index, t)
     return index
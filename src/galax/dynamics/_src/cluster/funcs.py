@@ -6,11 +6,12 @@ __all__ = [
 ]
 
 from functools import partial
+from typing import cast
 
 import jax
 from jaxtyping import Float
 
-import coordinax as cx
+import quaxed.lax as qlax
 import quaxed.numpy as jnp
 import unxt as u
 
@@ -21,6 +22,12 @@ from galax.dynamics._src.api import omega
 # ===================================================================
 
 
+def _r_hat(x: gt.LengthBtSz3) -> gt.BtQuSz3:
+    """Radial unit vector ``x / |x|``, from a single ``rsqrt``."""
+    r_hat: gt.BtQuSz3 = x * qlax.rsqrt(jnp.sum(x**2, axis=-1, keepdims=True))
+    return r_hat
+
+
 @partial(jax.jit, inline=True)
 def tidal_radius(
     pot: gp.AbstractPotential,
@@ -64,8 +71,50 @@ def tidal_radius(
     >>> tidal_radius(pot, x, v, prog_mass=prog_mass, t=u.Quantity(0, "Myr"))
     Quantity['length'](Array(0.06362008, dtype=float64), unit='kpc')
     """
-    d2phi_dr2 = pot.d2potential_dr2(x, t)
-    return jnp.cbrt(pot.constants["G"] * prog_mass / (omega(x, v) ** 2 - d2phi_dr2))
+    r_hat = _r_hat(x)
+    r_t: u.Quantity = _tidal_radius(pot, x, r_hat, omega(x, v), prog_mass, t)
+    return r_t
+
+
+@partial(jax.jit, inline=True)
+def _tidal_radius(
+    pot: gp.AbstractPotential,
+    x: gt.LengthBtSz3,
+    r_hat: gt.BtQuSz3,
+    om: gt.BBtFloatQuSz0,
+    /,
+    prog_mass: gt.MassBBtSz0,
+    t: gt.TimeBBtSz0,
+) -> gt.BBtFloatQuSz0:
+    """Compute the tidal radius from a precomputed ``r_hat`` and ``omega``.
+
+    Callers that need the radial unit vector and orbital frequency themselves,
+    e.g. the stream distribution functions, use this to compute them once.
+
+    Parameters
+    ----------
+    pot : `galax.potential.AbstractPotential`
+        The gravitational potential of the host.
+    x: Quantity[float, (3,), "length"]
+        3d position (x, y, z).
+    r_hat: Quantity[float, (3,), "dimensionless"]
+        Unit vector along ``x``.
+    om: Quantity[float, (), "frequency"]
+        Orbital frequency, see `galax.dynamics.omega`.
+    prog_mass : Quantity[float, (), "mass"]
+        Cluster mass.
+    t: Quantity[float, (), "time"]
+        Time.
+
+    """
+    # d2phi/dr2 = r_hat . (H . r_hat), from a single Hessian-vector product.
+    r_hat = u.ustrip("", r_hat)
+    H_rhat = pot._hvp(x, u.Quantity.from_(t, pot.units["time"]), r_hat)  # noqa: SLF001
+    d2phi_dr2 = jnp.sum(H_rhat * r_hat, axis=-1)
+    # `jnp.cbrt` is typed as returning an Array, but preserves the Quantity.
+    return cast(
+        gt.BBtFloatQuSz0, jnp.cbrt(pot.constants["G"] * prog_mass / (om**2 - d2phi_dr2))
+    )
 
 
 # ===================================================================
@@ -116,8 +165,8 @@ def lagrange_points(
     >>> L2
     Quantity['length'](Array([8.02929074, 0.        , 0.        ], dtype=float64), unit='kpc')
     """  # noqa: E501
-    r_hat = cx.vecs.normalize_vector(x)
-    r_t = tidal_radius(potential, x, v, prog_mass, t)
+    r_hat = _r_hat(x)
+    r_t = _tidal_radius(potential, x, r_hat, omega(x, v), prog_mass, t)
     L_1 = x - r_hat * r_t  # close
     L_2 = x + r_hat * r_t  # far
     return L_1, L_2
@@ -34,6 +34,7 @@ Times: TypeAlias = gt.QuSzTime | gt.SzTime
 save_t1_only = dfx.SaveAt(t1=True)
 default_solver = dfx.Dopri8(scan_kind="bounded")
 default_stepsize_controller = dfx.PIDController(rtol=1e-7, atol=1e-7)
+default_adjoint = dfx.RecursiveCheckpointAdjoint()
 
 
 @final
@@ -47,12 +48,15 @@ class Integrator(eqx.Module, strict=True):  # type: ignore[call-arg,misc]
 
     Parameters
     ----------
-    solver : diffrax.AbstractSolver, optional
-        The solver to use. Default is
-        :class:`diffrax.Dopri8`(``scan_kind="bounded"``).
-    stepsize_controller : diffrax.AbstractStepSizeController, optional
-        The stepsize controller to use. Default is a PID controller with
-        relative and absolute tolerances of 1e-7.
+    dynamics_solver : DynamicsSolver, optional
+        The solver to use. Can be anything that
+        :meth:`galax.dynamics.DynamicsSolver.from_` accepts, e.g. a
+        :class:`diffraxtra.DiffEqSolver`. The default wraps
+        :class:`diffrax.Dopri8`(``scan_kind="bounded"``) with a PID stepsize
+        controller with relative and absolute tolerances of 1e-7, and
+        differentiates through the solve with
+        :class:`diffrax.RecursiveCheckpointAdjoint`. For stiff problems use an
+        implicit solver, e.g. :class:`diffrax.Kvaerno5`.
     diffeq_kw : Mapping[str, Any], optional
         Keyword arguments to pass to :func:`diffrax.diffeqsolve`. Default is
         ``{"max_steps": None, "event": None}``. The ``"max_steps"`` key is
@@ -172,13 +176,25 @@ class Integrator(eqx.Module, strict=True):  # type: ignore[call-arg,misc]
         t=Quantity['time'](Array(..., dtype=float64), unit='Gyr'),
         frame=SimulationFrame()
     )
+
+    The solver can be changed, e.g. to an implicit solver for stiff problems:
+
+    >>> import diffrax as dfx
+    >>> import diffraxtra as dfxtra
+    >>> stiff_integrator = gd.integrate.Integrator(
+    ...     dfxtra.DiffEqSolver(dfx.Kvaerno5(),
+    ...         stepsize_controller=dfx.PIDController(rtol=1e-7, atol=1e-7)))
+    >>> w = stiff_integrator(field, w0, t0, t1)
+    >>> w.shape
+    (2,)
     """
 
     dynamics_solver: DynamicsSolver = eqx.field(
         default=DynamicsSolver(
             dfxtra.DiffEqSolver(
-                solver=dfx.Dopri8(scan_kind="bounded"),
-                stepsize_controller=dfx.PIDController(rtol=1e-7, atol=1e-7),
+                solver=default_solver,
+                stepsize_controller=default_stepsize_controller,
+                adjoint=default_adjoint,
             )
         ),
         converter=DynamicsSolver.from_,
@@ -17,7 +17,8 @@ import quaxed.numpy as jnp
 import galax.potential as gp
 import galax.typing as gt
 from .base import AbstractStreamDF
-from galax.dynamics._src.cluster.funcs import tidal_radius
+from galax.dynamics._src.api import omega
+from galax.dynamics._src.cluster.funcs import _r_hat, _tidal_radius
 from galax.dynamics._src.register_api import specific_angular_momentum
 
 # ============================================================
@@ -71,8 +72,7 @@ class ChenStreamDF(AbstractStreamDF):
         # Random number generation
 
         # x_new-hat
-        r = jnp.linalg.vector_norm(x, axis=-1, keepdims=True)
-        x_new_hat = x / r
+        x_new_hat = _r_hat(x)
 
         # z_new-hat
         L_vec = specific_angular_momentum(x, v)
@@ -82,7 +82,7 @@ class ChenStreamDF(AbstractStreamDF):
         phi_vec = v - jnp.sum(v * x_new_hat, axis=-1, keepdims=True) * x_new_hat
         y_new_hat = cx.vecs.normalize_vector(phi_vec)
 
-        r_tidal = tidal_radius(potential, x, v, prog_mass, t)
+        r_tidal = _tidal_radius(potential, x, x_new_hat, omega(x, v), prog_mass, t)
 
         # Bill Chen: method="cholesky" doesn't work here!
         posvel = jr.multivariate_normal(
@@ -17,7 +17,7 @@ import galax.potential as gp
 import galax.typing as gt
 from .base import AbstractStreamDF
 from galax.dynamics._src.api import omega
-from galax.dynamics._src.cluster.funcs import tidal_radius
+from galax.dynamics._src.cluster.funcs import _r_hat, _tidal_radius
 
 # ============================================================
 # Constants
@@ -56,15 +56,14 @@ class FardalStreamDF(AbstractStreamDF):
         t: gt.BBtFloatQuSz0,
     ) -> tuple[gt.LengthBtSz3, gt.SpeedBtSz3, gt.LengthBtSz3, gt.SpeedBtSz3]:
         """Generate stream particle initial conditions."""
-        # Random number generation
-        key1, key2, key3, key4 = jr.split(key, 4)
-
-        om = omega(x, v)[..., None]
+        om = omega(x, v)
 
         # r-hat
-        r_hat = cx.vecs.normalize_vector(x)
+        r_hat = _r_hat(x)
 
-        r_tidal = tidal_radius(potential, x, v, prog_mass, t)[..., None]
+        # The tidal radius shares r-hat and omega with the rest of the sampling.
+        r_tidal = _tidal_radius(potential, x, r_hat, om, prog_mass, t)[..., None]
+        om = om[..., None]
         v_circ = om * r_tidal  # relative velocity
 
         # z-hat
@@ -75,12 +74,12 @@ class FardalStreamDF(AbstractStreamDF):
         phi_vec = v - jnp.sum(v * r_hat, axis=-1, keepdims=True) * r_hat
         phi_hat = cx.vecs.normalize_vector(phi_vec)
 
-        # k vals
-        shape = r_tidal.shape
-        kr_samp = kr_bar + jr.normal(key1, shape) * sigma_kr
-        kvphi_samp = kr_samp * (kvphi_bar + jr.normal(key2, shape) * sigma_kvphi)
-        kz_samp = kz_bar + jr.normal(key3, shape) * sigma_kz
-        kvz_samp = kvz_bar + jr.normal(key4, shape) * sigma_kvz
+        # k vals. All the noise is drawn in one call, not one per k.
+        noise = jr.normal(key, (4, *r_tidal.shape))
+        kr_samp = kr_bar + noise[0] * sigma_kr
+        kvphi_samp = kr_samp * (kvphi_bar + noise[1] * sigma_kvphi)
+        kz_samp = kz_bar + noise[2] * sigma_kz
+        kvz_samp = kvz_bar + noise[3] * sigma_kvz
 
         # Trailing arm
         x_trail = x + r_tidal * (kr_samp * r_hat + kz_samp * z_hat)
@@ -4,7 +4,7 @@ __all__ = ["MockStreamGenerator"]
 
 from dataclasses import KW_ONLY, replace
 from functools import partial
-from typing import TypeAlias, cast, final
+from typing import cast, final
 
 import equinox as eqx
 import jax
@@ -16,17 +16,17 @@ import unxt as u
 from unxt.quantity import UncheckedQuantity as FastQ
 
 import galax.coordinates as gc
+import galax.dynamics._src.custom_types as gdt
 import galax.typing as gt
 from .core import MockStream, MockStreamArm
 from .df import AbstractStreamDF, ProgenitorMassCallable
 from .utils import cond_reverse
+from galax.dynamics._src.dynamics import HamiltonianField
 from galax.dynamics._src.integrate.funcs import _default_integrator, evaluate_orbit
 from galax.dynamics._src.integrate.integrator import Integrator
 from galax.dynamics._src.orbit import Orbit
 from galax.potential import AbstractPotential
 
-Carry: TypeAlias = tuple[gt.IntSz0, gt.SzN, gt.SzN]
-
 
 @final
 class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
@@ -70,54 +70,74 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
 
     # ==========================================================================
 
+    def _qp_arr(self, w: gc.AbstractPhaseSpacePosition) -> gdt.BtQParr:
+        """Unitless ``(q, p)`` arrays of ``w`` in the generator's unit system."""
+        q, p = w._qp(units=self.units)  # noqa: SLF001
+        return q.ustrip(self.units["length"]), p.ustrip(self.units["speed"])
+
+    def _stack_lead_trail(
+        self, mock0_lead: MockStreamArm, mock0_trail: MockStreamArm
+    ) -> gdt.BtQParr:
+        """Stack the leading and trailing arms into ``(N, 2, 3)`` arrays.
+
+        This only reshapes the initial conditions, so the scan and vmap paths
+        can map over one array of pairs.
+        """
+        return jax.tree.map(
+            lambda lead, trail: jnp.stack([lead, trail], axis=1),
+            self._qp_arr(mock0_lead),
+            self._qp_arr(mock0_trail),
+        )
+
+    def _integrate_lead_trail(
+        self, t_i: gt.FloatQuSz0, t_f: gt.FloatQuSz0, qp0_lt_i: gdt.BtQParr
+    ) -> gdt.BtQParr:
+        """Integrate one leading/trailing pair from its release time to ``t_f``.
+
+        Only the final state is saved, so the solve has no intermediate save
+        times to interpolate to. The two particles are solved separately, each
+        with its own adaptive step size and error control.
+        """
+        field = HamiltonianField(self.potential)
+
+        def integrate(q: gdt.Qarr, p: gdt.Parr) -> gdt.QParr:
+            w = self.stream_integrator(field, (q, p), t_i, t_f)
+            return self._qp_arr(w)
+
+        return jax.vmap(integrate)(*qp0_lt_i)
+
     @partial(jax.jit)
     def _run_scan(  # TODO: output shape depends on the input shape
         self,
         ts: gt.QuSzTime,
         mock0_lead: MockStreamArm,
         mock0_trail: MockStreamArm,
-    ) -> tuple[gt.BtSz6, gt.BtSz6]:
+    ) -> tuple[gdt.BtQParr, gdt.BtQParr]:
         """Generate stellar stream by scanning over the release model/integration.
 
         Better for CPU usage.
         """
-        w0_lead = mock0_lead.w(units=self.units)
-        w0_trail = mock0_trail.w(units=self.units)
         t_f = ts[-1] + u.Quantity(1e-3, ts.unit)  # TODO: not bump in the final time.
 
         def one_pt_intg(
-            carry: Carry, _: gt.IntSz0
-        ) -> tuple[Carry, tuple[gt.SzN, gt.SzN]]:
-            """Integrate one point along the stream.
+            carry: None, x: tuple[gt.FloatQuSz0, gdt.BtQParr]
+        ) -> tuple[None, gdt.BtQParr]:
+            """Integrate one pair of points along the stream.
 
             Parameters
             ----------
-            carry : tuple[int, SzN, SzN]
-                Initial state of the particle at index `idx`.
-            idx : int
-                Index of the current point.
+            carry : None
+                Unused.
+            x : tuple[Quantity[float, (), 'time'], tuple[Array, Array]]
+                The release time and the (2, 3) initial positions and
+                velocities of the leading and trailing particles released at
+                that time.
             """
-            i, w0_l_i, w0_t_i = carry
-            tstep = jnp.asarray([ts[i], t_f])
-
-            def integ_ics(ics: gt.Sz6) -> gt.SzN:
-                # TODO: only return the final state
-                return evaluate_orbit(
-                    self.potential, ics, tstep, integrator=self.stream_integrator
-                ).w(units=self.units)[-1]
-
-            # vmap integration over leading and trailing arm
-            w0_lt_i = jnp.vstack([w0_l_i, w0_t_i])
-            w_l, w_t = jax.vmap(integ_ics, in_axes=(0,))(w0_lt_i)
-            # Prepare for next iteration
-            carry_out = (i + 1, w0_lead[i + 1, :], w0_trail[i + 1, :])
-            return carry_out, (w_l, w_t)
-
-        carry_init = (0, w0_lead[0, :], w0_trail[0, :])
-        pt_ids = jnp.arange(len(w0_lead))
-        lead_arm_w, trail_arm_w = jax.lax.scan(one_pt_intg, carry_init, pt_ids)[1]
+            return carry, self._integrate_lead_trail(x[0], t_f, x[1])
 
-        return lead_arm_w, trail_arm_w
+        qp0_lt = self._stack_lead_trail(mock0_lead, mock0_trail)
+        q_lt, p_lt = jax.lax.scan(one_pt_intg, None, (ts, qp0_lt))[1]
+        return (q_lt[:, 0], p_lt[:, 0]), (q_lt[:, 1], p_lt[:, 1])
 
     @partial(jax.jit)
     def _run_vmap(  # TODO: output shape depends on the input shape
@@ -125,31 +145,20 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
         ts: gt.QuSzTime,
         mock0_lead: MockStreamArm,
         mock0_trail: MockStreamArm,
-    ) -> tuple[gt.BtSz6, gt.BtSz6]:
+    ) -> tuple[gdt.BtQParr, gdt.BtQParr]:
         """Generate stellar stream by vmapping over the release model/integration.
 
         Better for GPU usage.
         """
         t_f = ts[-1] + u.Quantity(1e-3, ts.unit)  # TODO: not bump in the final time.
 
-        @partial(jax.jit, inline=True)
-        def one_pt_intg(
-            i: gt.IntSz0, w0_l_i: gt.Sz6, w0_t_i: gt.Sz6
-        ) -> tuple[gt.Sz6, gt.Sz6]:
-            tstep = jnp.asarray([ts[i], t_f])
-            w_lead = evaluate_orbit(
-                self.potential, w0_l_i, tstep, integrator=self.stream_integrator
-            ).w(units=self.potential.units)[-1]
-            w_trail = evaluate_orbit(
-                self.potential, w0_t_i, tstep, integrator=self.stream_integrator
-            ).w(units=self.potential.units)[-1]
-            return w_lead, w_trail
-
-        w0_lead = mock0_lead.w(units=self.units)
-        w0_trail = mock0_trail.w(units=self.units)
-        pt_ids = jnp.arange(len(w0_lead))
-        lead_arm_w, trail_arm_w = jax.vmap(one_pt_intg)(pt_ids, w0_lead, w0_trail)
-        return lead_arm_w, trail_arm_w
+        # Map over the release times directly, rather than over an index into
+        # them, so there is no integer state to gather with.
+        qp0_lt = self._stack_lead_trail(mock0_lead, mock0_trail)
+        q_lt, p_lt = jax.vmap(self._integrate_lead_trail, in_axes=(0, None, 0))(
+            ts, t_f, qp0_lt
+        )
+        return (q_lt[:, 0], p_lt[:, 0]), (q_lt[:, 1], p_lt[:, 1])
 
     @partial(jax.jit, static_argnames=("vmapped",))
     def run(
@@ -236,9 +245,13 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
         mock0 = self.df.sample(rng, self.potential, prog_o, prog_mass)
 
         if use_vmap:
-            lead_arm_w, trail_arm_w = self._run_vmap(ts, mock0["lead"], mock0["trail"])
+            lead_arm_qp, trail_arm_qp = self._run_vmap(
+                ts, mock0["lead"], mock0["trail"]
+            )
         else:
-            lead_arm_w, trail_arm_w = self._run_scan(ts, mock0["lead"], mock0["trail"])
+            lead_arm_qp, trail_arm_qp = self._run_scan(
+                ts, mock0["lead"], mock0["trail"]
+            )
 
         t = jnp.ones_like(ts) * ts.value[-1]  # TODO: ensure this time is correct
 
@@ -250,15 +263,15 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
 
         comps = {}
         comps["lead"] = MockStreamArm(
-            q=FastQ(lead_arm_w[:, 0:3], self.units["length"]),
-            p=FastQ(lead_arm_w[:, 3:6], self.units["speed"]),
+            q=FastQ(lead_arm_qp[0], self.units["length"]),
+            p=FastQ(lead_arm_qp[1], self.units["speed"]),
             t=t,
             release_time=mock0["lead"].release_time,
             frame=frame,
         )
         comps["trail"] = MockStreamArm(
-            q=FastQ(trail_arm_w[:, 0:3], self.units["length"]),
-            p=FastQ(trail_arm_w[:, 3:6], self.units["speed"]),
+            q=FastQ(trail_arm_qp[0], self.units["length"]),
+            p=FastQ(trail_arm_qp[1], self.units["speed"]),
             t=t,
             release_time=mock0["trail"].release_time,
             frame=frame,
@@ -2,27 +2,15 @@
 
 __all__: list[str] = []
 
-from functools import partial
-from typing import TypeVar, cast
+from typing import cast
 
-import jax
 from jaxtyping import Array, Bool
-from quax import quaxify
 
-from galax.utils._types import SupportsGetItem
+import quaxed.numpy as jnp
 
-T = TypeVar("T")
-T_co = TypeVar("T_co", covariant=True)
+import galax.typing as gt
 
 
-def _identity(x: T) -> T:
-    return x
-
-
-@partial(quaxify)  # TODO: move this `quaxify` up the function call stack
-def _reverse(x: SupportsGetItem[T]) -> T:
-    return x[::-1]
-
-
-def cond_reverse(pred: Bool[Array, ""], x: T) -> T:
-    return cast(T, jax.lax.cond(pred, _reverse, _identity, x))
+def cond_reverse(pred: Bool[Array, ""], x: gt.QuSzTime) -> gt.QuSzTime:
+    # Both branches are cheap, so select with `where` rather than `lax.cond`.
+    return cast(gt.QuSzTime, jnp.where(pred, x[::-1], x))  # type: ignore[call-overload]
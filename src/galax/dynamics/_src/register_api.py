@@ -109,9 +109,10 @@ def omega(
     >>> omega(x, v)
     Quantity['frequency'](Array(1., dtype=float64), unit='1 / s')
     """
-    r = jnp.linalg.vector_norm(x, axis=-1, keepdims=True)
-    omega = jnp.linalg.cross(x, v) / r**2
-    return jnp.linalg.vector_norm(omega, axis=-1)
+    # |x cross v| / |x|^2, dividing once by the sum of squares rather than
+    # dividing each component of the cross product by the squared norm.
+    r2 = jnp.sum(x**2, axis=-1)
+    return jnp.linalg.vector_norm(jnp.linalg.cross(x, v), axis=-1) / r2
 
 
 @dispatch
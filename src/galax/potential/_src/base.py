@@ -17,7 +17,7 @@ from plum import dispatch
 import coordinax as cx
 import quaxed.numpy as jnp
 import unxt as u
-from unxt.quantity import AbstractQuantity
+from unxt.quantity import AbstractQuantity, UncheckedQuantity as FastQ
 from xmmutablemap import ImmutableMap
 
 import galax.typing as gt
@@ -174,10 +174,27 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
     @vectorize_method(signature="(3),()->(3)")
     def _gradient(self, q: gt.BtFloatQuSz3, t: gt.RealQuSz0, /) -> gt.BtQuSz3:
         """See ``gradient``."""
-        grad_op = u.experimental.grad(
-            self._potential, units=(self.units["length"], self.units["time"])
-        )
-        return grad_op(q, t)
+        units = self.units
+
+        def potential_fn(x: gt.Sz3) -> gt.FloatSz0:
+            q_ = u.Quantity(x, units["length"])
+            return self._potential(q_, t).ustrip(units["specific energy"])
+
+        # The output units are known from the unit system, so there's no need
+        # to separately evaluate the potential to get them.
+        x = u.ustrip(units["length"], q)
+        return u.Quantity(jax.grad(potential_fn)(x), units["acceleration"])
+
+    @partial(jax.jit, inline=True)
+    def _gradient_arr(self, x: gt.Sz3, t: gt.RealQuSz0, /) -> gt.Sz3:
+        """Unit-stripped ``_gradient``, for taking higher derivatives.
+
+        ``x`` and the output are in the length and acceleration units of the
+        potential's unit system.
+        """
+        units = self.units
+        q = FastQ(x, units["length"])
+        return self._gradient(q, t).ustrip(units["acceleration"])
 
     def gradient(
         self: "AbstractPotential", *args: Any, **kwargs: Any
@@ -195,10 +212,10 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
     @vectorize_method(signature="(3),()->()")
     def _laplacian(self, q: gt.BtFloatQuSz3, /, t: gt.RealQuSz0) -> gt.FloatQuSz0:
         """See ``laplacian``."""
-        jac_op = u.experimental.jacfwd(  # spatial jacobian
-            self._gradient, argnums=0, units=(self.units["length"], self.units["time"])
-        )
-        return jnp.trace(jac_op(q, t))
+        # trace(H) = sum_i e_i^T H e_i, where each H e_i is a Hessian-vector
+        # product. This avoids building the full Jacobian of the gradient.
+        eye = jnp.eye(3, dtype=q.dtype)
+        return jnp.sum(eye * self._hvp(q, t, eye))
 
     def laplacian(
         self: "AbstractPotential", *args: Any, **kwargs: Any
@@ -217,7 +234,7 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
         self, q: gt.BtFloatQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
     ) -> gt.BtFloatQuSz0:
         """See ``density``."""
-        # Note: trace(jacobian(gradient)) is faster than trace(hessian(energy))
+        # Note: sum of HVPs is faster than trace(hessian(energy))
         return self._laplacian(q, t) / (4 * jnp.pi * self.constants["G"])
 
     def density(
@@ -236,10 +253,39 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
     @vectorize_method(signature="(3),()->(3,3)")
     def _hessian(self, q: gt.BtFloatQuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
         """See ``hessian``."""
-        hess_op = u.experimental.hessian(
-            self._potential, units=(self.units["length"], self.units["time"])
+        units = self.units
+        x = u.ustrip(units["length"], q)
+        hess = jax.jacfwd(self._gradient_arr)(x, t)
+        return u.Quantity(hess, units["acceleration"] / units["length"])
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),(),(3)->(3)")
+    def _hvp(self, q: gt.BtFloatQuSz3, t: gt.RealQuSz0, v: gt.Sz3, /) -> gt.BtQuSz3:
+        """Compute the Hessian-vector product ``H @ v``.
+
+        This uses forward-over-reverse mode AD: a JVP of the gradient along
+        ``v``, which costs about as much as one more gradient evaluation and
+        never materializes the full Hessian.
+
+        Parameters
+        ----------
+        q : Quantity[float, (*batch, 3), 'length']
+            The Cartesian position.
+        t : Quantity[float, (), 'time']
+            The time.
+        v : Array[float, (*batch, 3)]
+            The (unitless) direction vector.
+
+        Returns
+        -------
+        Quantity[float, (*batch, 3), '1/s^2']
+        """
+        units = self.units
+        x = u.ustrip(units["length"], q)
+        _, hv = jax.jvp(
+            lambda x: self._gradient_arr(x, t), (x,), (jnp.asarray(v, dtype=x.dtype),)
         )
-        return hess_op(q, t)
+        return FastQ(hv, units["acceleration"] / units["length"])
 
     def hessian(self: "AbstractPotential", *args: Any, **kwargs: Any) -> gt.BtQuSz33:
         """Compute the hessian of the potential at the given position(s).
@@ -4,7 +4,15 @@ __all__ = ["AbstractCompositePotential"]
 
 
 import uuid
-from collections.abc import Hashable, ItemsView, Iterator, KeysView, Mapping, ValuesView
+from collections.abc import (
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    ValuesView,
+)
 from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
@@ -21,6 +29,57 @@ if TYPE_CHECKING:
     import galax.potential  # noqa: ICN001
 
 
+def _group_key(pot: AbstractPotential) -> Hashable | None:
+    """Key of potentials that can be stacked and evaluated together.
+
+    Potentials with the same pytree structure (so the same class, static fields
+    and units) and array leaves of the same shape and dtype can have their
+    leaves stacked. Potentials with non-array leaves, e.g. functions, can't be.
+    """
+    leaves, treedef = jax.tree.flatten(pot)
+    if not all(eqx.is_array(x) for x in leaves):
+        return None
+    return treedef, tuple((x.shape, x.dtype) for x in leaves)
+
+
+def _sum_potentials(
+    pots: Iterable[AbstractPotential], q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+) -> gt.SpecificEnergyBtSz0:
+    """Sum the potential energies of ``pots``.
+
+    Potentials that can be stacked (see ``_group_key``) are grouped, have their
+    parameters stacked, and are evaluated with a single `jax.vmap`, so the
+    traced graph has one copy of each group's potential, not one per
+    component. The group totals are accumulated eagerly.
+    """
+    groups: dict[Hashable, list[AbstractPotential]] = {}
+    singles: list[AbstractPotential] = []
+    for pot in pots:
+        key = _group_key(pot)
+        if key is None:
+            singles.append(pot)
+        else:
+            groups.setdefault(key, []).append(pot)
+
+    terms: list[gt.SpecificEnergyBtSz0] = []
+    for group in groups.values():
+        if len(group) == 1:
+            singles.append(group[0])
+            continue
+        stacked = jax.tree.map(lambda *xs: jax.numpy.stack(xs), *group)
+        phis = jax.vmap(lambda p: p._potential(q, t))(stacked)  # noqa: SLF001
+        terms.append(cast(gt.SpecificEnergyBtSz0, jnp.sum(phis, axis=0)))
+    terms.extend(pot._potential(q, t) for pot in singles)  # noqa: SLF001
+
+    if not terms:
+        msg = "cannot sum the potential energies of zero potentials"
+        raise ValueError(msg)
+    out = terms[0]
+    for phi in terms[1:]:
+        out = out + phi
+    return out
+
+
 # Note: cannot have `strict=True` because of inheriting from ImmutableMap.
 class AbstractCompositePotential(AbstractPotential):
     """Base class for composite potentials."""
@@ -33,10 +92,7 @@ class AbstractCompositePotential(AbstractPotential):
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
-        return jnp.sum(
-            jnp.array([p._potential(q, t) for p in self.values()]),  # noqa: SLF001
-            axis=0,
-        )
+        return _sum_potentials(self.values(), q, t)
 
     # ===========================================
     # Collection Protocol
@@ -53,32 +53,21 @@ class BarPotential(AbstractSinglePotential):
     def _potential(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.SpecificEnergySz0:
         ## First take the simulation frame coordinates and rotate them by Omega*t
         ang = -self.Omega(t) * t
-        rotation_matrix = jnp.asarray(
-            [
-                [jnp.cos(ang), -jnp.sin(ang), 0],
-                [jnp.sin(ang), jnp.cos(ang), 0.0],
-                [0.0, 0.0, 1.0],
-            ],
-        )
-        q_corot = jnp.matmul(rotation_matrix, q)
+        cos_ang, sin_ang = jnp.cos(ang), jnp.sin(ang)
+        x = cos_ang * q[0] - sin_ang * q[1]
+        y = sin_ang * q[0] + cos_ang * q[1]
+        z = q[2]
 
         a = self.a(t)
         b = self.b(t)
         c = self.c(t)
-        T_plus = jnp.sqrt(
-            (a + q_corot[0]) ** 2
-            + q_corot[1] ** 2
-            + (b + jnp.sqrt(c**2 + q_corot[2] ** 2)) ** 2
-        )
-        T_minus = jnp.sqrt(
-            (a - q_corot[0]) ** 2
-            + q_corot[1] ** 2
-            + (b + jnp.sqrt(c**2 + q_corot[2] ** 2)) ** 2
-        )
+        _temp = y**2 + (b + jnp.sqrt(c**2 + z**2)) ** 2
+        T_plus = jnp.sqrt((a + x) ** 2 + _temp)
+        T_minus = jnp.sqrt((a - x) ** 2 + _temp)
 
         # potential in a corotating frame
         return (self.constants["G"] * self.m_tot(t) / (2.0 * a)) * jnp.log(
-            (q_corot[0] - a + T_minus) / (q_corot[0] + a + T_plus),
+            (x - a + T_minus) / (x + a + T_plus),
         )
 
 
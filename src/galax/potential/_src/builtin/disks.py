@@ -15,6 +15,7 @@ import equinox as eqx
 import jax
 from jaxtyping import Array
 
+import quaxed.lax as qlax
 import quaxed.numpy as jnp
 import unxt as u
 from unxt.unitsystems import AbstractUnitSystem, dimensionless
@@ -93,7 +94,7 @@ class MiyamotoNagaiPotential(AbstractSinglePotential):
     ) -> gt.SpecificEnergyBtSz0:
         R2 = q[..., 0] ** 2 + q[..., 1] ** 2
         zp2 = (jnp.sqrt(q[..., 2] ** 2 + self.b(t) ** 2) + self.a(t)) ** 2
-        return -self.constants["G"] * self.m_tot(t) / jnp.sqrt(R2 + zp2)
+        return -self.constants["G"] * self.m_tot(t) * qlax.rsqrt(R2 + zp2)
 
 
 # -------------------------------------------------------------------
@@ -152,7 +153,10 @@ class AbstractMN3Potential(AbstractSinglePotential):
         default=default_constants, converter=ImmutableMap
     )
 
-    def _get_mn_components(self, t: gt.BBtRealQuSz0, /) -> list[MiyamotoNagaiPotential]:
+    def _get_mn_params(
+        self, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.QuSz3, gt.QuSz3, gt.FloatQuSz0]:
+        """Masses, ``a`` and (shared) ``b`` of the Miyamoto-Nagai components."""
         hR = self.h_R(t)
         hzR = (self.h_z(t) / hR).decompose(dimensionless).value
         K = _mn3_K_pos_dens if self.positive_density else _mn3_K_neg_dens
@@ -164,35 +168,33 @@ class AbstractMN3Potential(AbstractSinglePotential):
         param_vec = K @ x
 
         # use fitting function to get the Miyamoto-Nagai component parameters
-        mn_ms = param_vec[:3] * self.m_tot(t)
-        mn_as = param_vec[3:] * hR
+        mn_ms = self.m_tot(t) * param_vec[:3]
+        mn_as = hR * param_vec[3:]
         mn_b = b_hR * hR
+        return mn_ms, mn_as, mn_b
+
+    def _get_mn_components(self, t: gt.BBtRealQuSz0, /) -> list[MiyamotoNagaiPotential]:
+        mn_ms, mn_as, mn_b = self._get_mn_params(t)
         return [
-            MiyamotoNagaiPotential(
-                m_tot=mn_ms[0], a=mn_as[0], b=mn_b, units=self.units
-            ),
-            MiyamotoNagaiPotential(
-                m_tot=mn_ms[1], a=mn_as[1], b=mn_b, units=self.units
-            ),
-            MiyamotoNagaiPotential(
-                m_tot=mn_ms[2], a=mn_as[2], b=mn_b, units=self.units
-            ),
+            MiyamotoNagaiPotential(m_tot=m, a=a, b=mn_b, units=self.units)
+            for m, a in zip(mn_ms, mn_as, strict=True)
         ]
 
     @partial(jax.jit)
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
+        # The Miyamoto-Nagai potential is evaluated directly on the stacked
+        # component parameters, rather than constructing the component
+        # potentials. The components are the last axis.
+        mn_ms, mn_as, mn_b = self._get_mn_params(t)
+        R2 = (q[..., 0] ** 2 + q[..., 1] ** 2)[..., None]
+        zp2 = (jnp.sqrt(q[..., 2:3] ** 2 + mn_b**2) + mn_as) ** 2
         unit = self.units["specific energy"]
         return u.Quantity(
             jnp.sum(
-                jnp.asarray(
-                    [
-                        mn.potential(q, t).to_value(unit)
-                        for mn in self._get_mn_components(t)
-                    ]
-                ),
-                axis=0,
+                u.ustrip(unit, -self.constants["G"] * mn_ms * qlax.rsqrt(R2 + zp2)),
+                axis=-1,
             ),
             unit,
         )
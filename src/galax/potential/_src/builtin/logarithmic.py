@@ -42,8 +42,8 @@ class LogarithmicPotential(AbstractSinglePotential):
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
         r_s = self.r_s(t).ustrip(self.units["length"])
-        r = jnp.linalg.vector_norm(q, axis=-1).ustrip(self.units["length"])
-        return 0.5 * self.v_c(t) ** 2 * jnp.log(r_s**2 + r**2)
+        r2 = jnp.sum(q**2, axis=-1).ustrip(self.units["length"] ** 2)
+        return 0.5 * self.v_c(t) ** 2 * jnp.log(r_s**2 + r2)
 
 
 @final
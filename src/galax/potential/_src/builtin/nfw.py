@@ -70,7 +70,7 @@ class NFWPotential(AbstractSinglePotential):
         r_s = self.r_s(t)
         u = r / r_s
         v_h2 = self.constants["G"] * self.m(t) / r_s
-        return -v_h2 * jnp.log(1.0 + u) / u
+        return -v_h2 * jnp.log1p(u) / u
 
     @partial(jax.jit)
     def _density(
@@ -267,7 +267,7 @@ class LeeSutoTriaxialNFWPotential(AbstractSinglePotential):
         u = r / r_s
 
         # The functions F1, F2, and F3 and some useful quantities
-        log1pu = jnp.log(1 + u)
+        log1pu = jnp.log1p(u)
         u2 = u**2
         um3 = u ** (-3)
         costh2 = q[..., 2] ** 2 / r**2  # z^2 / r^2
@@ -567,4 +567,4 @@ class Vogelsberger08TriaxialNFWPotential(AbstractSinglePotential):
         /,
     ) -> gt.SpecificEnergyBtSz0:
         r = self._r_tilde(q, t)
-        return -self.constants["G"] * self.m(t) * jnp.log(1.0 + r / self.r_s(t)) / r
+        return -self.constants["G"] * self.m(t) * jnp.log1p(r / self.r_s(t)) / r
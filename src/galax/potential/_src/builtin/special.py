@@ -17,7 +17,6 @@ from typing_extensions import override
 import equinox as eqx
 import jax
 
-import quaxed.numpy as jnp
 import unxt as u
 from unxt.unitsystems import AbstractUnitSystem, galactic
 from xmmutablemap import ImmutableMap
@@ -29,7 +28,10 @@ from .logarithmic import LMJ09LogarithmicPotential
 from .nfw import NFWPotential
 from .spherical import HernquistPotential, PowerLawCutoffPotential
 from galax.potential._src.base import AbstractPotential, default_constants
-from galax.potential._src.base_multi import AbstractCompositePotential
+from galax.potential._src.base_multi import (
+    AbstractCompositePotential,
+    _sum_potentials,
+)
 
 
 class AbstractSpecialPotential(AbstractCompositePotential):  # TODO: make public
@@ -97,10 +99,7 @@ class AbstractSpecialPotential(AbstractCompositePotential):  # TODO: make public
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
-        return jnp.sum(
-            jnp.array([getattr(self, k)._potential(q, t) for k in self._keys]),  # noqa: SLF001
-            axis=0,
-        )
+        return _sum_potentials([getattr(self, k) for k in self._keys], q, t)
 
     # ===========================================
     # Collection Protocol
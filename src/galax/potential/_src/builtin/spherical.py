@@ -218,9 +218,9 @@ class IsochronePotential(AbstractSinglePotential):
     def _potential(  # TODO: inputs w/ units
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
-        r = jnp.linalg.vector_norm(q, axis=-1)
+        r2 = jnp.sum(q**2, axis=-1)
         b = self.b(t)
-        return -self.constants["G"] * self.m_tot(t) / (b + jnp.sqrt(r**2 + b**2))
+        return -self.constants["G"] * self.m_tot(t) / (b + jnp.sqrt(r2 + b**2))
 
 
 # -------------------------------------------------------------------
@@ -309,7 +309,7 @@ class PlummerPotential(AbstractSinglePotential):
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
-        r2 = jnp.linalg.vector_norm(q, axis=-1) ** 2
+        r2 = jnp.sum(q**2, axis=-1)
         return -self.constants["G"] * self.m_tot(t) / jnp.sqrt(r2 + self.b(t) ** 2)
 
 
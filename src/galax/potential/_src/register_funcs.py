@@ -463,11 +463,12 @@ def d2potential_dr2(
         Time in [Myr]
 
     """
-    x = parse_to_quantity(x, unit=pot.units["length"])
-    rhat = cx.vecs.normalize_vector(x)
-    H = pot.hessian(x, t=t)
-    # vectorized dot product of rhat · H · rhat
-    return jnp.einsum("...i,...ij,...j -> ...", rhat, H, rhat)
+    x = parse_to_quantity(x, dtype=float, unit=pot.units["length"])
+    t = u.Quantity.from_(t, pot.units["time"])
+    rhat = cx.vecs.normalize_vector(u.ustrip(pot.units["length"], x))
+    # rhat · (H · rhat), with H · rhat from a single Hessian-vector product
+    Hrhat = pot._hvp(x, t, rhat)  # noqa: SLF001
+    return jnp.sum(Hrhat * rhat, axis=-1)
 
 
 @dispatch
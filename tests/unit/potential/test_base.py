@@ -151,6 +151,13 @@ class AbstractPotential_Test(GalaIOMixin, metaclass=ABCMeta):
         """Test the `AbstractPotential.hessian` method."""
         ...
 
+    def test_laplacian(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
+        """Test the `AbstractPotential.laplacian` method."""
+        expect = jnp.trace(pot.hessian(x, t=0))
+        assert jnp.allclose(
+            pot.laplacian(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        )
+
     def test_acceleration(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
         """Test the `AbstractPotential.acceleration` method."""
         acc = convert(pot.acceleration(x, t=0), u.Quantity)
@@ -262,11 +269,12 @@ class TestAbstractPotential(AbstractPotential_Test):
 
     def test_density(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
         """Test the `AbstractPotential.density` method."""
-        # TODO: fix negative density!!!
-        expect = u.Quantity(-2.647e-7, pot.units["mass density"])
-        assert jnp.allclose(
-            pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        # A point mass has zero density away from the origin, so the result is
+        # only round-off, which is small compared to the Hessian's scale.
+        scale = jnp.max(jnp.abs(pot.hessian(x, t=0))) / (
+            4 * jnp.pi * pot.constants["G"]
         )
+        assert jnp.abs(pot.density(x, t=0)) < 1e-12 * scale
 
     def test_hessian(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
         """Test the `AbstractPotential.hessian` method."""
@@ -296,6 +296,34 @@ class TestCompositePotential(AbstractCompositePotential_Test):
             pot.potential(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
         )
 
+    def test_potential_same_class(self, x: Sz3) -> None:
+        """Test components of the same class, which are evaluated together."""
+        pot = gp.CompositePotential(
+            disk=gp.MiyamotoNagaiPotential(
+                m_tot=u.Quantity(1e10, "solMass"),
+                a=u.Quantity(6.5, "kpc"),
+                b=u.Quantity(4.5, "kpc"),
+                units=galactic,
+            ),
+            disk2=gp.MiyamotoNagaiPotential(
+                m_tot=u.Quantity(2e10, "solMass"),
+                a=u.Quantity(3.0, "kpc"),
+                b=u.Quantity(0.5, "kpc"),
+                units=galactic,
+            ),
+            halo=gp.NFWPotential(
+                m=u.Quantity(1e12, "solMass"), r_s=u.Quantity(5, "kpc"), units=galactic
+            ),
+        )
+        expect = (
+            pot["disk"].potential(x, t=0)
+            + pot["disk2"].potential(x, t=0)
+            + pot["halo"].potential(x, t=0)
+        )
+        assert jnp.isclose(
+            pot.potential(x, t=0), expect, atol=u.Quantity(1e-15, expect.unit)
+        )
+
     def test_gradient(self, pot: gp.CompositePotential, x: Sz3) -> None:
         expect = u.Quantity(
             [0.01124388, 0.02248775, 0.03382281], pot.units["acceleration"]
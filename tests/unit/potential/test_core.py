@@ -100,11 +100,12 @@ class TestAbstractSinglePotential(AbstractSinglePotential_Test):
 
     def test_density(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
         """Test the `AbstractPotential.density` method."""
-        # TODO: fix negative density!!!
-        expect = u.Quantity(-2.647e-7, pot.units["mass density"])
-        assert jnp.allclose(
-            pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        # A point mass has zero density away from the origin, so the result is
+        # only round-off, which is small compared to the Hessian's scale.
+        scale = jnp.max(jnp.abs(pot.hessian(x, t=0))) / (
+            4 * jnp.pi * pot.constants["G"]
         )
+        assert jnp.abs(pot.density(x, t=0)) < 1e-12 * scale
 
     def test_hessian(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
         """Test the `AbstractPotential.hessian` method."""
@@ -42,33 +42,41 @@ def test_bar_means_of_rotation() -> None:
 
     # They should be equivalent at t=0
     assert framedpot.potential(q, t) == hardpot.potential(q, t)
-    assert jnp.array_equal(
+    assert jnp.allclose(
         convert(framedpot.acceleration(q, t), u.Quantity),
         convert(hardpot.acceleration(q, t), u.Quantity),
+        rtol=1e-15,
+        atol=u.Quantity(1e-18, "kpc / Myr2"),
     )
 
     # They should be equivalent at t=110 Myr (1/2 period)
     t = u.Quantity(110, "Myr")
     assert framedpot.potential(q, t) == hardpot.potential(q, t)
-    assert jnp.array_equal(
+    assert jnp.allclose(
         convert(framedpot.acceleration(q, t), u.Quantity),
         convert(hardpot.acceleration(q, t), u.Quantity),
+        rtol=1e-15,
+        atol=u.Quantity(1e-18, "kpc / Myr2"),
     )
 
     # They should be equivalent at t=220 Myr (1 period)
     t = u.Quantity(220, "Myr")
     assert framedpot.potential(q, t) == hardpot.potential(q, t)
-    assert jnp.array_equal(
+    assert jnp.allclose(
         convert(framedpot.acceleration(q, t), u.Quantity),
         convert(hardpot.acceleration(q, t), u.Quantity),
+        rtol=1e-15,
+        atol=u.Quantity(1e-18, "kpc / Myr2"),
     )
 
     # They should be equivalent at t=55 Myr (1/4 period)
     t = u.Quantity(55, "Myr")
     assert framedpot.potential(q, t) == hardpot.potential(q, t)
-    assert jnp.array_equal(
+    assert jnp.allclose(
         convert(framedpot.acceleration(q, t), u.Quantity),
         convert(hardpot.acceleration(q, t), u.Quantity),
+        rtol=1e-15,
+        atol=u.Quantity(1e-18, "kpc / Myr2"),
     )
 
     # TODO: move this test to a more appropriate location